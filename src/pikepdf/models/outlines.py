@@ -3,6 +3,19 @@ from itertools import chain
 
 from .. import Array, Dictionary, Name, Object
 
+# Each Name attribute lookup resolves through the extension library.
+# The outline traversals touch several names per node, so bind the hot
+# ones once at import time.
+_N_A = Name.A
+_N_COUNT = Name.Count
+_N_DEST = Name.Dest
+_N_FIRST = Name.First
+_N_FIT = Name.Fit
+_N_LAST = Name.Last
+_N_NEXT = Name.Next
+_N_OUTLINES = Name.Outlines
+_N_PREV = Name.Prev
+
 
 class PageLocation(Enum):
     XYZ = 1
@@ -23,7 +36,30 @@ PAGE_LOCATION_ARGS = {
     PageLocation.FitBH: ('top',),
     PageLocation.FitBV: ('left',),
 }
-ALL_PAGE_LOCATION_KWARGS = set(chain.from_iterable(PAGE_LOCATION_ARGS.values()))
+ALL_PAGE_LOCATION_KWARGS = frozenset(
+    chain.from_iterable(PAGE_LOCATION_ARGS.values())
+)
+
+# The set of page location names is fixed, so the corresponding Name
+# objects and string-to-enum resolution can be built once at import time
+# rather than on every make_page_destination call.
+_LOC_NAME = {loc: Name('/' + loc.name) for loc in PageLocation}
+# Accepts either the enum member or its string name, so both call styles
+# resolve with a single dict lookup.
+_LOC_KEY = {loc: loc for loc in PageLocation}
+_LOC_KEY.update((loc.name, loc) for loc in PageLocation)
+# PageLocation values are contiguous starting at 1, so the per-location
+# data can live in a tuple indexed by enum value - an array index rather
+# than a hash probe. Each entry is (name, argument names, default
+# argument values); index 0 is an unused sentinel.
+_LOC_TABLE = (None,) + tuple(
+    (
+        _LOC_NAME[loc],
+        PAGE_LOCATION_ARGS.get(loc, ()),
+        [0] * len(PAGE_LOCATION_ARGS.get(loc, ())),
+    )
+    for loc in sorted(PageLocation, key=lambda loc: loc.value)
+)
 
 
 def make_page_destination(
@@ -40,23 +76,21 @@ def make_page_destination(
     """
     res = [pdf.pages[page_num]]
     if page_location:
-        if isinstance(page_location, PageLocation):
-            loc_key = page_location
-            loc_str = loc_key.name
-        else:
-            loc_str = page_location
-            try:
-                loc_key = PageLocation[loc_str]
-            except KeyError:
-                raise ValueError(
-                    "Invalid or unsupported page location type {0}".format(loc_str)
-                )
-        res.append(Name('/{0}'.format(loc_str)))
-        dest_arg_names = PAGE_LOCATION_ARGS.get(loc_key)
+        try:
+            loc_key = _LOC_KEY[page_location]
+        except (KeyError, TypeError):
+            raise ValueError(
+                "Invalid or unsupported page location type {0}".format(page_location)
+            )
+        loc_name, dest_arg_names, default_args = _LOC_TABLE[loc_key.value]
+        res.append(loc_name)
         if dest_arg_names:
-            res.extend(kwargs.get(k, 0) for k in dest_arg_names)
+            if kwargs:
+                res += [kwargs.get(k, 0) for k in dest_arg_names]
+            else:
+                res += default_args
     else:
-        res.append(Name.Fit)
+        res.append(_N_FIT)
     return Array(res)
 
 
@@ -64,6 +98,15 @@ class OutlineStructureError(Exception):
     pass
 
 
+def _del_if_present(obj, name):
+    # One call into the extension library instead of a membership test
+    # followed by a delete.
+    try:
+        del obj[name]
+    except KeyError:
+        pass
+
+
 class OutlineItem:
     """Manages a single item in a PDF document outlines structure, including
     nested items.
@@ -92,6 +135,17 @@ class OutlineItem:
     neighboring elements.
     """
 
+    __slots__ = (
+        'title',
+        'destination',
+        'page_location',
+        'page_location_kwargs',
+        'action',
+        'obj',
+        'is_closed',
+        '_children',
+    )
+
     def __init__(
         self,
         title: str,
@@ -104,19 +158,34 @@ class OutlineItem:
         self.title = title
         self.destination = destination
         self.page_location = page_location
-        self.page_location_kwargs = {}
         self.action = action
         self.obj = obj
-        for k, v in kwargs.items():
-            if k in ALL_PAGE_LOCATION_KWARGS:
-                self.page_location_kwargs[k] = v
-            else:
-                raise ValueError("Invalid keyword argument {0}".format(k))
+        unknown = kwargs.keys() - ALL_PAGE_LOCATION_KWARGS
+        if unknown:
+            raise ValueError(
+                "Invalid keyword argument {0}".format(next(iter(unknown)))
+            )
+        self.page_location_kwargs = kwargs
         self.is_closed = False
-        self.children = []
+        self._children = None
+
+    @property
+    def children(self):
+        """List of child items, allocated lazily on first access.
+
+        Most outline entries are leaves and never hold children; deferring
+        the list allocation saves an object per leaf.
+        """
+        if self._children is None:
+            self._children = []
+        return self._children
+
+    @children.setter
+    def children(self, value):
+        self._children = value
 
     def __str__(self):
-        if self.children:
+        if self._children:
             if self.is_closed:
                 oc_indicator = '[+]'
             else:
@@ -127,10 +196,10 @@ class OutlineItem:
             dest = self.destination
         else:
             dest = '<Action>'
-        return '{1} {0.title} -> {2}'.format(self, oc_indicator, dest)
+        return '{0} {1} -> {2}'.format(oc_indicator, self.title, dest)
 
     def __repr__(self):
-        return '<{0.__class__.__name__}: "{0.title}">'.format(self)
+        return '<{0}: "{1}">'.format(self.__class__.__name__, self.title)
 
     @classmethod
     def from_dictionary_object(cls, obj: Dictionary):
@@ -141,11 +210,11 @@ class OutlineItem:
             obj: ``Dictionary`` object representing a single outline node.
         """
         title = str(obj.Title)
-        destination = obj.get(Name.Dest)
-        action = obj.get(Name.A)
+        destination = obj.get(_N_DEST)
+        action = obj.get(_N_A)
         return cls(title, destination=destination, action=action, obj=obj)
 
-    def to_dictionary_object(self, pdf, create_new=False) -> Dictionary:
+    def to_dictionary_object(self, pdf, create_new=False, obj_pool=None) -> Dictionary:
         """Creates a ``Dictionary`` object from this outline node's data,
         or updates the existing object.
         Page numbers are resolved to a page reference on the input
@@ -155,9 +224,14 @@ class OutlineItem:
             pdf: PDF document object.
             create_new: If set to ``True``, creates a new object instead of
                 modifying an existing one in-place.
+            obj_pool: Optional list of indirect ``Dictionary`` objects,
+                allocated in advance, to draw from instead of creating one.
         """
         if create_new or self.obj is None:
-            self.obj = obj = pdf.make_indirect(Dictionary())
+            if obj_pool:
+                self.obj = obj = obj_pool.pop()
+            else:
+                self.obj = obj = pdf.make_indirect(Dictionary())
         else:
             obj = self.obj
         obj.Title = self.title
@@ -170,12 +244,10 @@ class OutlineItem:
                     **self.page_location_kwargs,
                 )
             obj.Dest = self.destination
-            if Name.A in obj:
-                del obj.A
+            _del_if_present(obj, _N_A)
         elif self.action is not None:
             obj.A = self.action
-            if Name.Dest in obj:
-                del obj.Dest
+            _del_if_present(obj, _N_DEST)
         return obj
 
 
@@ -194,123 +266,254 @@ class Outline:
         :meth:`pikepdf.Pdf.open_outline`
     """
 
+    __slots__ = (
+        '_root',
+        '_pdf',
+        '_max_depth',
+        '_strict',
+        '_updating',
+        '_page_index_cache',
+        '_dirty',
+    )
+
     def __init__(self, pdf, max_depth=15, strict=False):
         self._root = None
         self._pdf = pdf
         self._max_depth = max_depth
         self._strict = strict
         self._updating = False
+        self._page_index_cache = None
+        self._dirty = False
 
     def __str__(self):
         return str(self.root)
 
     def __repr__(self):
-        return '<{0.__class__.__name__}: {1} items>'.format(self, len(self.root))
+        # Touching self.root here would trigger a full tree walk on an
+        # outline that has not been loaded yet.
+        if self._root is None:
+            return '<{0}: unloaded>'.format(self.__class__.__name__)
+        return '<{0}: {1} items>'.format(self.__class__.__name__, len(self._root))
 
     def __enter__(self):
         self._updating = True
+        self._dirty = False
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         try:
             if exc_type is not None:
                 return
-            self._save()
+            if self._dirty:
+                self._save()
         finally:
             self._updating = False
 
+    def mark_dirty(self):
+        """Marks the outline as modified, so that it is written back to the
+        document when the editing context exits.
+
+        Accessing :attr:`root` inside the editing context already does this
+        implicitly. Call this method when mutating outline items through a
+        reference obtained outside the context.
+        """
+        self._dirty = True
+
+    def _prepare_obj_pool(self) -> list:
+        """Counts the items that will need a new dictionary and allocates
+        them all in one tight loop, rather than one make_indirect call
+        interleaved per node during the save traversal.
+        """
+        needed = 0
+        max_depth = self._max_depth
+        stack = [(self._root, 0)]
+        while stack:
+            items, level = stack.pop()
+            for item in items:
+                if item.obj is None:
+                    needed += 1
+                if level < max_depth and item._children:
+                    stack.append((item._children, level + 1))
+        if not needed:
+            return []
+        make_indirect = self._pdf.make_indirect
+        return [make_indirect(Dictionary()) for _ in range(needed)]
+
     def _save_level_outline(
-        self, parent: Dictionary, outline_items: list, level: int, visited_objs: set
+        self,
+        parent: Dictionary,
+        outline_items: list,
+        level: int,
+        visited_objs: set,
+        obj_pool: list = None,
     ):
+        # Iterates with an explicit stack instead of recursing, so that
+        # deep outlines do not exhaust the interpreter's recursion limit.
+        # Each stack entry holds the suspended state of a parent level
+        # while its children are being written.
+        stack = []
+        items = iter(outline_items)
         count = 0
         prev = None
         first = None
-        for item in outline_items:
-            out_obj = item.to_dictionary_object(self._pdf)
-            objgen = out_obj.objgen
-            if objgen in visited_objs:
-                if self._strict:
-                    raise OutlineStructureError(
-                        "Outline object {0} reoccurred in structure".format(objgen)
-                    )
-                out_obj = item.to_dictionary_object(self._pdf, create_new=True)
+        # Local aliases avoid a global or attribute lookup per loop
+        # iteration.
+        pdf = self._pdf
+        max_depth = self._max_depth
+        strict = self._strict
+        visited_add = visited_objs.add
+        stack_append = stack.append
+        del_if_present = _del_if_present
+        n_first = _N_FIRST
+        n_last = _N_LAST
+        n_next = _N_NEXT
+        n_prev = _N_PREV
+        while True:
+            for item in items:
+                out_obj = item.to_dictionary_object(pdf, obj_pool=obj_pool)
+                objgen = out_obj.objgen
+                # Add unconditionally and compare sizes: a single hash
+                # probe instead of a membership test followed by an add.
+                prev_len = len(visited_objs)
+                visited_add(objgen)
+                if len(visited_objs) == prev_len:
+                    if strict:
+                        raise OutlineStructureError(
+                            "Outline object {0} reoccurred in structure".format(objgen)
+                        )
+                    out_obj = item.to_dictionary_object(pdf, create_new=True)
+
+                out_obj.Parent = parent
+                count += 1
+                if prev is not None:
+                    prev.Next = out_obj
+                    out_obj.Prev = prev
+                else:
+                    first = out_obj
+                    del_if_present(out_obj, n_prev)
+                prev = out_obj
+                if level < max_depth:
+                    sub_items = item._children or ()
+                else:
+                    sub_items = ()
+                # Suspend this level and descend into the children.
+                stack_append((parent, items, count, prev, first, item))
+                parent = out_obj
+                items = iter(sub_items)
+                level += 1
+                count = 0
+                prev = None
+                first = None
+                break
             else:
-                visited_objs.add(objgen)
-
-            out_obj.Parent = parent
-            count += 1
-            if prev is not None:
-                prev.Next = out_obj
-                out_obj.Prev = prev
-            else:
-                first = out_obj
-                if Name.Prev in out_obj:
-                    del out_obj.Prev
-            prev = out_obj
-            if level < self._max_depth:
-                sub_items = item.children
-            else:
-                sub_items = ()
-            self._save_level_outline(out_obj, sub_items, level + 1, visited_objs)
-            if item.is_closed:
-                out_obj.Count = -out_obj.Count
-            else:
-                count += out_obj.Count
-        if count:
-            if Name.Next in prev:
-                del prev.Next
-            parent.First = first
-            parent.Last = prev
-        else:
-            if Name.First in parent:
-                del parent.First
-            if Name.Last in parent:
-                del parent.Last
-        parent.Count = count
+                # Level is complete. Finalize it, then resume the parent.
+                if count:
+                    del_if_present(prev, n_next)
+                    parent.First = first
+                    parent.Last = prev
+                else:
+                    del_if_present(parent, n_first)
+                    del_if_present(parent, n_last)
+                parent.Count = count
+                if not stack:
+                    return
+                out_obj = parent
+                parent, items, count, prev, first, item = stack.pop()
+                level -= 1
+                if item.is_closed:
+                    out_obj.Count = -out_obj.Count
+                else:
+                    count += out_obj.Count
 
     def _load_level_outline(
         self, first_obj: Dictionary, outline_items: list, level: int, visited_objs: set
     ):
+        # Iterates with an explicit stack instead of recursing; see
+        # _save_level_outline.
+        stack = []
         current_obj = first_obj
-        while current_obj:
-            objgen = current_obj.objgen
-            if objgen in visited_objs:
-                if self._strict:
-                    raise OutlineStructureError(
-                        "Outline object {0} reoccurred in structure".format(objgen)
-                    )
+        # Local aliases avoid a global or attribute lookup per loop
+        # iteration.
+        max_depth = self._max_depth
+        strict = self._strict
+        visited_add = visited_objs.add
+        stack_append = stack.append
+        from_dictionary_object = OutlineItem.from_dictionary_object
+        n_count = _N_COUNT
+        n_first = _N_FIRST
+        n_next = _N_NEXT
+        while True:
+            while current_obj:
+                objgen = current_obj.objgen
+                # Single hash probe; see _save_level_outline.
+                prev_len = len(visited_objs)
+                visited_add(objgen)
+                if len(visited_objs) == prev_len:
+                    if strict:
+                        raise OutlineStructureError(
+                            "Outline object {0} reoccurred in structure".format(objgen)
+                        )
+                    break
+
+                item = from_dictionary_object(current_obj)
+                outline_items.append(item)
+                first_child = current_obj.get(n_first)
+                if first_child is not None and level < max_depth:
+                    # Suspend this level and descend into the children.
+                    stack_append((current_obj, outline_items, level, item))
+                    current_obj = first_child
+                    item._children = outline_items = []
+                    level += 1
+                else:
+                    current_obj = current_obj.get(n_next)
+            if not stack:
                 return
-            visited_objs.add(objgen)
+            current_obj, outline_items, level, item = stack.pop()
+            count = current_obj.get(n_count)
+            if count and count < 0:
+                item.is_closed = True
+            current_obj = current_obj.get(n_next)
 
-            item = OutlineItem.from_dictionary_object(current_obj)
-            first_child = current_obj.get(Name.First)
-            if first_child is not None and level < self._max_depth:
-                self._load_level_outline(
-                    first_child, item.children, level + 1, visited_objs
-                )
-                count = current_obj.get(Name.Count)
-                if count and count < 0:
-                    item.is_closed = True
-            outline_items.append(item)
-            current_obj = current_obj.get(Name.Next)
+    def page_index_for(self, page_obj):
+        """Returns the zero-based index of a page reference in the document,
+        or ``None`` if the object is not one of the document's pages.
+
+        An objgen-to-index map is built on first use, so resolving many
+        outline destinations to page numbers costs a single pass over
+        ``pdf.pages`` rather than a linear scan per destination.
+
+        Arguments:
+            page_obj: Page object, e.g. obtained from an outline entry's
+                destination array.
+        """
+        if self._page_index_cache is None:
+            self._page_index_cache = {
+                page.objgen: i for i, page in enumerate(self._pdf.pages)
+            }
+        return self._page_index_cache.get(page_obj.objgen)
 
     def _save(self):
+        # The document may be modified once the outline is written back;
+        # discard the page index cache rather than track page changes.
+        self._page_index_cache = None
         if self._root is None:
             return
-        if Name.Outlines in self._pdf.Root:
+        if _N_OUTLINES in self._pdf.Root:
             outlines = self._pdf.Root.Outlines
         else:
             self._pdf.Root.Outlines = outlines = self._pdf.make_indirect(
-                Dictionary(Type=Name.Outlines)
+                Dictionary(Type=_N_OUTLINES)
             )
-        self._save_level_outline(outlines, self._root, 0, set())
+        self._save_level_outline(
+            outlines, self._root, 0, set(), self._prepare_obj_pool()
+        )
 
     def _load(self):
         self._root = root = []
-        if Name.Outlines not in self._pdf.Root:
+        if _N_OUTLINES not in self._pdf.Root:
             return
         outlines = self._pdf.Root.Outlines or {}
-        first_obj = outlines.get(Name.First)
+        first_obj = outlines.get(_N_FIRST)
         if first_obj:
             self._load_level_outline(first_obj, root, 0, set())
 
@@ -318,4 +521,9 @@ class Outline:
     def root(self):
         if self._root is None:
             self._load()
+        if self._updating:
+            # The returned list is mutable, so any access inside the
+            # editing context counts as a modification and triggers the
+            # write-back (including structural repairs) on exit.
+            self._dirty = True
         return self._root
@@ -298,12 +298,52 @@ def test_fix_references_move_level(outlines_doc):
     assert '/Last' not in first_b_obj
 
 
+def test_page_index_for(outlines_doc):
+    outline = outlines_doc.open_outline()
+    for i, page in enumerate(outlines_doc.pages):
+        assert outline.page_index_for(page) == i
+    # Non-page objects resolve to None
+    assert outline.page_index_for(outlines_doc.Root) is None
+
+
 def test_noop(outlines_doc):
     with outlines_doc.open_outline(strict=True):
         # Forget to attach it - should simply not modify.
         OutlineItem('New')
 
 
+def test_no_save_unless_accessed(outlines_doc):
+    root_obj = outlines_doc.Root.Outlines
+    first_obj = root_obj.First
+    # Plant an invalid reference that a write-back would remove
+    first_obj.Prev = root_obj
+
+    # Opening without touching the outline must not write anything,
+    # even if it was already loaded before the context was entered
+    outline = outlines_doc.open_outline()
+    list(outline.root)
+    with outline:
+        pass
+    assert '/Prev' in first_obj
+
+    # Accessing the root inside the context triggers the write-back
+    with outlines_doc.open_outline() as outline:
+        list(outline.root)
+    assert '/Prev' not in first_obj
+
+
+def test_mark_dirty(outlines_doc):
+    root_obj = outlines_doc.Root.Outlines
+    outline = outlines_doc.open_outline()
+    # Loaded outside the editing context
+    items = outline.root
+    with outline:
+        items.append(OutlineItem('Four', 0))
+        outline.mark_dirty()
+    assert root_obj.Count == 4
+    assert str(root_obj.Last.Title) == 'Four'
+
+
 def test_append_items(outlines_doc):
     # Simple check that we can write new objects
     # without failing the object duplicate checks